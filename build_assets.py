@@ -0,0 +1,230 @@
+"""Build size-optimised asset variants and a content-hashed manifest.
+
+Run before packaging the web/APK build with pygbag:
+
+    python build_assets.py --stage build/pygame_car_dodger
+    pygbag build/pygame_car_dodger
+
+Audio is re-encoded to OGG Vorbis with ffmpeg and images are resized and
+palettised with Pillow. The build fails if either tool is missing, unless
+--allow-fallback is given, in which case the original file is copied.
+
+The asset list lives in assets/assets.json, shared with main.py.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+SOURCE_DIR = "./assets"
+OUTPUT_DIR = "./assets/build"
+ASSET_TABLE = "assets.json"
+MANIFEST_NAME = "manifest.json"
+STAGE_MARKER = ".build_assets_stage"  # Marks a stage directory this script may replace
+
+# ffmpeg arguments per audio kind - mono low-rate SFX, low-bitrate stereo music
+AUDIO_SETTINGS = {
+    "sfx": ["-ac", "1", "-ar", "22050", "-c:a", "libvorbis", "-q:a", "2"],
+    "music": ["-ar", "44100", "-c:a", "libvorbis", "-q:a", "1"],
+}
+PALETTE_COLORS = 64
+
+
+class BuildError(Exception):
+    pass
+
+
+def load_asset_table(source_dir):
+    with open(os.path.join(source_dir, ASSET_TABLE)) as f:
+        return json.load(f)
+
+
+def have_pillow():
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def missing_tools(assets):
+    """Return the tools needed by these assets that are not installed"""
+    kinds = {settings["kind"] for settings in assets.values()}
+    missing = []
+    if kinds & set(AUDIO_SETTINGS) and shutil.which("ffmpeg") is None:
+        missing.append("ffmpeg (audio)")
+    if "image" in kinds and not have_pillow():
+        missing.append("Pillow (images)")
+    return missing
+
+
+def encode_audio(source, target, kind):
+    """Re-encode audio to OGG, returning False if ffmpeg is unavailable or fails"""
+    if shutil.which("ffmpeg") is None:
+        return False
+    command = ["ffmpeg", "-y", "-loglevel", "error", "-i", source, "-vn"]
+    command += AUDIO_SETTINGS[kind] + [target]
+    try:
+        subprocess.run(command, check=True)
+    except subprocess.CalledProcessError as error:
+        print(f"ffmpeg failed for {source}: {error}")
+        return False
+    return True
+
+
+def optimise_image(source, target, size):
+    """Resize and palettise a PNG, returning False if Pillow is not available"""
+    if not have_pillow():
+        return False
+    from PIL import Image
+    with Image.open(source) as image:
+        image = image.convert("RGBA").resize(tuple(size), Image.LANCZOS)
+        image = image.quantize(colors=PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+        image.save(target, optimize=True)
+    return True
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_asset(name, settings, source_dir, work_dir, allow_fallback):
+    """Produce the optimised variant of one asset in work_dir and return its path"""
+    source = os.path.join(source_dir, name)
+    stem, ext = os.path.splitext(name)
+
+    if settings["kind"] == "image":
+        target = os.path.join(work_dir, stem + ".png")
+        if optimise_image(source, target, settings["size"]):
+            return target
+    else:
+        target = os.path.join(work_dir, stem + ".ogg")
+        if encode_audio(source, target, settings["kind"]):
+            return target
+
+    if not allow_fallback:
+        raise BuildError(f"Could not optimise {name} (use --allow-fallback to copy it unchanged)")
+    print(f"Copying {name} unchanged")
+    target = os.path.join(work_dir, name)
+    shutil.copyfile(source, target)
+    return target
+
+
+def check_output(output_dir):
+    """Refuse to build into a non-empty directory that was not written by this script"""
+    if os.path.isdir(output_dir) and os.listdir(output_dir) \
+            and not os.path.exists(os.path.join(output_dir, MANIFEST_NAME)):
+        raise BuildError(f"{output_dir} is not empty and has no {MANIFEST_NAME} - refusing to overwrite it")
+
+
+def clean_output(output_dir):
+    """Remove the files listed in a previous manifest, leaving anything else alone"""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return
+    with open(manifest_path) as f:
+        previous = json.load(f)
+    for entry in previous.get("assets", {}).values():
+        # Only plain file names are ever written, so ignore anything that could escape output_dir
+        if entry["file"] == os.path.basename(entry["file"]):
+            path = os.path.join(output_dir, entry["file"])
+            if os.path.isfile(path):
+                os.remove(path)
+    os.remove(manifest_path)
+
+
+def build(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, allow_fallback=False):
+    assets = load_asset_table(source_dir)
+    missing = missing_tools(assets)
+    if missing and not allow_fallback:
+        raise BuildError(f"Missing {', '.join(missing)} (use --allow-fallback to copy originals unchanged)")
+    check_output(output_dir)
+
+    manifest = {"version": 1, "assets": {}}
+    original_total = optimised_total = 0
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Build every variant before touching output_dir, so a failure leaves the old build intact
+        built_files = {}
+        for name, settings in assets.items():
+            built = build_asset(name, settings, source_dir, work_dir, allow_fallback)
+            digest = file_hash(built)
+            stem, ext = os.path.splitext(os.path.basename(built))
+            hashed_name = f"{stem}.{digest[:10]}{ext}"
+            built_files[hashed_name] = built
+
+            original_size = os.path.getsize(os.path.join(source_dir, name))
+            size = os.path.getsize(built)
+            original_total += original_size
+            optimised_total += size
+            manifest["assets"][name] = dict(settings, file=hashed_name, sha256=digest, bytes=size)
+            print(f"{name:<26} {original_size:>8} -> {size:>8} bytes  {hashed_name}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        clean_output(output_dir)
+        for hashed_name, built in built_files.items():
+            shutil.move(built, os.path.join(output_dir, hashed_name))
+
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Total: {original_total} -> {optimised_total} bytes")
+    return manifest
+
+
+def check_stage(stage_dir):
+    """Refuse to stage into a non-empty directory that was not staged by this script"""
+    if os.path.isdir(stage_dir) and os.listdir(stage_dir) \
+            and not os.path.exists(os.path.join(stage_dir, STAGE_MARKER)):
+        raise BuildError(f"Stage directory {stage_dir} is not empty and was not created by build_assets.py")
+
+
+def stage(stage_dir, source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """Copy main.py and only the optimised assets into a directory for pygbag to package"""
+    check_stage(stage_dir)
+    staged_assets = os.path.join(stage_dir, "assets")
+    # Replace only what a previous stage wrote, leaving e.g. pygbag's build/ output alone
+    for path in [os.path.join(stage_dir, "main.py"), os.path.join(staged_assets, ASSET_TABLE)]:
+        if os.path.isfile(path):
+            os.remove(path)
+    if os.path.isdir(os.path.join(staged_assets, "build")):
+        shutil.rmtree(os.path.join(staged_assets, "build"))
+
+    game_dir = os.path.dirname(os.path.abspath(__file__))
+    os.makedirs(staged_assets, exist_ok=True)
+    with open(os.path.join(stage_dir, STAGE_MARKER), "w"):
+        pass
+    shutil.copyfile(os.path.join(game_dir, "main.py"), os.path.join(stage_dir, "main.py"))
+    shutil.copyfile(os.path.join(source_dir, ASSET_TABLE), os.path.join(staged_assets, ASSET_TABLE))
+    # main.py always looks for the manifest in assets/build
+    shutil.copytree(output_dir, os.path.join(staged_assets, "build"))
+    print(f"Staged web build in {stage_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build optimised Car Dodger assets")
+    parser.add_argument("--source", default=SOURCE_DIR, help="directory with the original assets")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="directory for optimised assets and manifest")
+    parser.add_argument("--allow-fallback", action="store_true",
+                        help="copy assets unchanged when ffmpeg or Pillow is missing")
+    parser.add_argument("--stage", metavar="DIR",
+                        help="also create DIR with main.py and only the optimised assets, for pygbag")
+    args = parser.parse_args()
+    if not os.path.isdir(args.source):
+        sys.exit(f"Asset directory not found: {args.source}")
+    try:
+        if args.stage:
+            check_stage(args.stage)
+        build(args.source, args.output, args.allow_fallback)
+        if args.stage:
+            stage(args.stage, args.source, args.output)
+    except BuildError as error:
+        sys.exit(str(error))
+
+
+if __name__ == "__main__":
+    main()
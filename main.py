@@ -2,34 +2,80 @@ import pygame
 import random
 import sys
 import math
+import os
+import gc
+import time
+import tracemalloc
+import atexit
+import signal
+import ast
+import json
+import functools
 
 # Initialize
 pygame.init()
 pygame.mixer.init()
 
-# Try to load sounds with error handling
-try:
-    pygame.mixer.music.load("./assets/bg_music.mp3")
-    pygame.mixer.music.play(-1)
-    crash_sound = pygame.mixer.Sound("./assets/crash-sound-effect.mp3")
-    swap_sound = pygame.mixer.Sound("./assets/swap.mp3")
-    sound_enabled = True
-except:
-    sound_enabled = False
-    print("Sound files not found - running without audio")
-
-# Try to load car images with fallback to colored rectangles
-try:
-    player_image = pygame.image.load("./assets/player_car.png")
-    enemy_image = pygame.image.load("./assets/enemy_car.png")
-    player_image = pygame.transform.scale(player_image, (40, 70))  # Rotated dimensions
-    enemy_image = pygame.transform.scale(enemy_image, (40, 70))    # Rotated dimensions
-    # Rotate images 90 degrees for vertical movement
-    player_image = pygame.transform.rotate(player_image, 270)
-    enemy_image = pygame.transform.rotate(enemy_image, 270)
-    images_loaded = True
-except:
-    images_loaded = False
+# Assets are listed in assets/assets.json; build_assets.py writes an optimised manifest
+ASSET_DIR = "./assets"
+ASSET_TABLE = "./assets/assets.json"
+ASSET_MANIFEST = "./assets/build/manifest.json"
+
+def load_asset_table():
+    """Return {name: entry} with a file path per asset, preferring the optimised build"""
+    try:
+        with open(ASSET_MANIFEST) as manifest_file:
+            assets = json.load(manifest_file)["assets"]
+        for entry in assets.values():
+            entry["path"] = os.path.join(os.path.dirname(ASSET_MANIFEST), entry["file"])
+        return assets
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        with open(ASSET_TABLE) as table_file:
+            assets = json.load(table_file)
+    except (OSError, ValueError):
+        return {}
+    for name, entry in assets.items():
+        entry["path"] = os.path.join(ASSET_DIR, name)
+    return assets
+
+sound_enabled = pygame.mixer.get_init() is not None
+images = {}
+sounds = {}
+
+def load_asset(name, entry):
+    """Load one asset into images/sounds (or start the music), keyed by file name stem"""
+    key = os.path.splitext(name)[0]
+    try:
+        if entry["kind"] == "image":
+            image = pygame.transform.scale(pygame.image.load(entry["path"]), entry["size"])  # Rotated dimensions
+            # Rotate images 90 degrees for vertical movement
+            images[key] = pygame.transform.rotate(image, 270)
+        elif not sound_enabled:
+            return
+        elif entry["kind"] == "music":
+            pygame.mixer.music.load(entry["path"])
+            pygame.mixer.music.play(-1)
+        else:
+            sounds[key] = pygame.mixer.Sound(entry["path"])
+    except (pygame.error, OSError):
+        print(f"Asset file {name} not found - running without it")
+
+# Critical assets load before the first frame, the rest are streamed in (see stream_assets)
+asset_table = load_asset_table()
+pending_assets = []
+for asset_name, asset_entry in asset_table.items():
+    if asset_entry["critical"]:
+        load_asset(asset_name, asset_entry)
+    else:
+        pending_assets.append((asset_name, asset_entry))
+
+# Fall back to colored rectangles without car images
+player_image = images.get("player_car")
+enemy_image = images.get("enemy_car")
+images_loaded = player_image is not None and enemy_image is not None
+if not images_loaded:
     print("Image files not found - using colored rectangles")
 
 # Constants
@@ -65,6 +111,11 @@ lane_height = HEIGHT // 5
 lanes = [lane_height * i + lane_height // 2 for i in range(1, 5)]  # 4 lanes vertically
 car_width, car_height = 80, 45  # Swapped for vertical orientation
 
+# Spawn scheduling
+lane_change_frames = 8  # Frames a player needs per lane change, used for passability checks
+spawn_lookahead = 4     # Waves generated ahead of the current one
+spawn_pattern_cache_size = 32  # Seeds kept for reuse across runs/simulations
+
 # Visual elements
 stripe_width, stripe_height, stripe_gap = 50, 8, 30  # Swapped for horizontal stripes
 stripe_color = YELLOW
@@ -92,7 +143,7 @@ player_lane = 1
 player_x = 120  # Now x position instead of y
 enemy_cars = []
 enemy_speed = 6
-spawn_timer = 0
+run_frame = 0  # Frames played this run, drives the spawn schedule
 score = 0
 high_score = 0
 game_speed = 1.0
@@ -108,6 +159,357 @@ touch_up_pressed = False
 touch_down_pressed = False
 touch_pause_pressed = False
 
+# Soak mode settings (long-running memory/GC diagnostics)
+SOAK_MODE = "--soak" in sys.argv or os.environ.get("CAR_DODGER_SOAK") == "1"
+soak_report_path = os.environ.get("CAR_DODGER_SOAK_REPORT", "soak_report.txt")
+soak_sample_interval = 600  # Frames between allocation/RSS samples (10s at 60 FPS)
+soak_report_interval = 30   # Samples between report rewrites (5 min), so a killed run leaves one
+soak_warmup_seconds = 60    # RSS growth rate ignores samples taken before this
+soak_traceback_depth = 4    # Frames kept per allocation on sampled frames, to find the calling game function
+soak_top_functions = 15     # Functions listed per section in the report
+soak_report_rows = 24       # Rows shown in the "Memory over time" table
+soak_helper_functions = ("draw_text", "draw_text_centered")  # Charged to their caller
+
+class SoakMonitor:
+    """Track per-frame allocations, GC pauses and RSS growth over a long run.
+
+    GC pauses, RSS and object counts are cheap and recorded throughout. tracemalloc
+    only runs on one frame per sample_interval so the game keeps its normal frame rate.
+    """
+    def __init__(self, sample_interval=soak_sample_interval):
+        self.sample_interval = sample_interval
+        self.start_time = time.perf_counter()
+        self.frames = 0
+        self.function_ranges = self.load_function_ranges()
+        self.sampling = False
+        self.finished = False
+
+        # Frames per game state, and memory high-water of the sampled ones
+        self.frame_counts = {}    # state -> frames
+        self.frame_stats = {}     # state -> [sampled frames, peak bytes, net bytes, max peak]
+        self.tracing = False
+
+        # Sampled frames: allocations per function still alive at the end of the frame
+        self.sampled_frames = 0
+        self.frame_allocs = {}    # function -> [blocks, bytes]
+
+        # Sampled frames: transient high-water of each call, including memory freed before return
+        self.call_stack = []      # [frame, function, base bytes, high bytes]
+        self.call_stats = {}      # function -> [calls, total high-water, max high-water]
+        self.frame_high = 0       # Highest traced memory of the frame, kept across reset_peak()
+
+        # GC pause stats
+        self.gc_start = None
+        self.gc_trigger = None
+        self.gc_stats = {}        # generation -> [count, total s, max s, collected]
+        self.gc_triggers = {}     # function -> [count, total s]
+
+        # Periodic samples: (seconds, frame, gc-tracked objects, rss bytes)
+        self.samples = []
+
+        # Built once - creating filters per snapshot allocates in fnmatch/re
+        self.filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "*/fnmatch.py"),
+            tracemalloc.Filter(False, "*/re/*"),
+        ]
+
+        self.record_sample()
+        gc.callbacks.append(self.on_gc)
+
+        # Write the report however the run ends; SIGTERM exits normally so atexit runs
+        atexit.register(self.finish)
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        except (AttributeError, ValueError):
+            pass
+
+    @staticmethod
+    def read_rss():
+        """Return current resident set size in bytes, or None if unavailable"""
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        try:
+            import resource
+            # ru_maxrss is the peak, in KB on Linux and bytes on macOS
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+        except (ImportError, OSError):
+            return None
+
+    @staticmethod
+    def format_bytes(n):
+        sign = "-" if n < 0 else ""
+        n = abs(n)
+        for unit in ["B", "KB", "MB"]:
+            if n < 1024:
+                return f"{sign}{n:.1f} {unit}"
+            n /= 1024
+        return f"{sign}{n:.1f} GB"
+
+    def load_function_ranges(self):
+        """Map line ranges of this file to function names for attribution"""
+        ranges = []
+        try:
+            with open(__file__) as source:
+                tree = ast.parse(source.read())
+        except (OSError, SyntaxError):
+            return ranges
+
+        def visit(node, prefix):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    name = prefix + child.name
+                    if not isinstance(child, ast.ClassDef):
+                        # Decorator lines count too - code objects start on the first one
+                        start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                        ranges.append((start, child.end_lineno, name))
+                    visit(child, name + ".")
+                else:
+                    visit(child, prefix)
+        visit(tree, "")
+        # Innermost (shortest) ranges first so nested functions win
+        ranges.sort(key=lambda r: r[1] - r[0])
+        return ranges
+
+    def function_for(self, filename, lineno):
+        if os.path.abspath(filename) != os.path.abspath(__file__):
+            return f"{os.path.basename(filename)}:{lineno}"
+        for start, end, name in self.function_ranges:
+            if start <= lineno <= end:
+                return name
+        return "<main loop>"
+
+    def attribute(self, traceback):
+        """Name the game function responsible for an allocation, or None if it is the monitor's own"""
+        names = [self.function_for(frame.filename, frame.lineno) for frame in traceback]
+        if any(name.startswith("SoakMonitor.") for name in names):
+            return None
+        # Tracebacks run oldest to most recent; charge to the innermost game function
+        game_names = [name for name, frame in zip(names, traceback)
+                      if os.path.abspath(frame.filename) == os.path.abspath(__file__)]
+        for name in reversed(game_names):
+            if name not in soak_helper_functions:
+                return name
+        return game_names[-1] if game_names else names[-1]
+
+    def take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self.filters)
+
+    def on_gc(self, phase, info):
+        # Collections caused by the monitor's own sampling are not game pauses
+        if self.sampling:
+            return
+        if phase == "start":
+            # Attribute the pause to the game function whose allocation triggered it
+            self.gc_trigger = "<unknown>"
+            frame = sys._getframe(1)
+            while frame is not None:
+                if frame.f_code.co_filename == __file__:
+                    self.gc_trigger = self.function_for(__file__, frame.f_lineno)
+                    break
+                frame = frame.f_back
+            self.gc_start = time.perf_counter()
+        elif self.gc_start is not None:
+            pause = time.perf_counter() - self.gc_start
+            self.gc_start = None
+            stats = self.gc_stats.setdefault(info["generation"], [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += pause
+            stats[2] = max(stats[2], pause)
+            stats[3] += info["collected"]
+            trigger = self.gc_triggers.setdefault(self.gc_trigger, [0, 0.0])
+            trigger[0] += 1
+            trigger[1] += pause
+
+    def on_call(self, frame, event, arg):
+        """Profile hook for sampled frames, measuring each game call's transient high-water"""
+        if event not in ("call", "return") or frame.f_code.co_filename != __file__:
+            return
+        if event == "call":
+            name = self.function_for(__file__, frame.f_lineno)
+            if name.startswith("SoakMonitor."):
+                return
+            current, peak = tracemalloc.get_traced_memory()
+            # reset_peak() below would lose the caller's and the frame's high-water, so keep them
+            self.frame_high = max(self.frame_high, peak)
+            if self.call_stack:
+                self.call_stack[-1][3] = max(self.call_stack[-1][3], peak)
+            tracemalloc.reset_peak()
+            self.call_stack.append([frame, name, current, current])
+        elif self.call_stack and self.call_stack[-1][0] is frame:
+            _, name, base, high = self.call_stack.pop()
+            high = max(high, tracemalloc.get_traced_memory()[1])
+            self.frame_high = max(self.frame_high, high)
+            if self.call_stack:
+                self.call_stack[-1][3] = max(self.call_stack[-1][3], high)
+            stats = self.call_stats.setdefault(name, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += high - base
+            stats[2] = max(stats[2], high - base)
+
+    def begin_frame(self):
+        if (self.frames + 1) % self.sample_interval == 0:
+            # Traces start empty, so the end-of-frame snapshot holds only what this frame kept
+            tracemalloc.start(soak_traceback_depth)
+            self.tracing = True
+            self.frame_high = 0
+            sys.setprofile(self.on_call)
+
+    def end_frame(self, frame_state):
+        self.frame_counts[frame_state] = self.frame_counts.get(frame_state, 0) + 1
+        if self.tracing:
+            sys.setprofile(None)
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.frame_high)
+            self.call_stack.clear()
+            stats = self.frame_stats.setdefault(frame_state, [0, 0, 0, 0])
+            stats[0] += 1
+            stats[1] += peak
+            stats[2] += current
+            stats[3] = max(stats[3], peak)
+            self.record_frame_allocs()
+            tracemalloc.stop()
+            self.tracing = False
+
+        self.frames += 1
+        if self.frames % self.sample_interval == 0:
+            self.record_sample()
+            if len(self.samples) % soak_report_interval == 0:
+                self.write_report()
+
+    def record_frame_allocs(self):
+        self.sampling = True
+        for stat in self.take_snapshot().statistics("traceback"):
+            name = self.attribute(stat.traceback)
+            if name is None:
+                continue
+            allocs = self.frame_allocs.setdefault(name, [0, 0])
+            allocs[0] += stat.count
+            allocs[1] += stat.size
+        self.sampled_frames += 1
+        self.sampling = False
+
+    def record_sample(self):
+        self.sampling = True
+        self.samples.append((time.perf_counter() - self.start_time, self.frames,
+                             len(gc.get_objects()), self.read_rss()))
+        self.sampling = False
+
+    def rss_growth_rate(self):
+        """Least-squares RSS slope in bytes/hour over samples after warm-up, or None"""
+        points = [(seconds, rss) for seconds, _, _, rss in self.samples
+                  if seconds >= soak_warmup_seconds and rss is not None]
+        if len(points) < 2:
+            return None
+        mean_t = sum(t for t, _ in points) / len(points)
+        mean_rss = sum(rss for _, rss in points) / len(points)
+        variance = sum((t - mean_t) ** 2 for t, _ in points)
+        if variance == 0:
+            return None
+        covariance = sum((t - mean_t) * (rss - mean_rss) for t, rss in points)
+        return covariance / variance * 3600
+
+    def finish(self):
+        """Stop tracing and write the final report; safe to call more than once"""
+        if self.finished:
+            return
+        self.finished = True
+        atexit.unregister(self.finish)
+        sys.setprofile(None)
+        if self.tracing:
+            tracemalloc.stop()
+            self.tracing = False
+        gc.callbacks.remove(self.on_gc)
+        self.record_sample()
+        self.write_report()
+
+    def write_report(self, path=soak_report_path):
+        elapsed = time.perf_counter() - self.start_time
+        lines = ["Car Dodger soak report",
+                 f"Duration: {elapsed:.1f}s, frames: {self.frames}", ""]
+
+        lines.append("Frame memory high-water (by state, sampled frames)")
+        for frame_state, frames in sorted(self.frame_counts.items()):
+            count, peak, net, max_peak = self.frame_stats.get(frame_state, [0, 0, 0, 0])
+            if not count:
+                lines.append(f"  {frame_state:<10} frames={frames:<8} sampled=0")
+                continue
+            lines.append(f"  {frame_state:<10} frames={frames:<8} sampled={count:<6} "
+                         f"avg peak={self.format_bytes(peak / count):<10} "
+                         f"avg kept={self.format_bytes(net / count):<10} max peak={self.format_bytes(max_peak)}")
+        lines.append("")
+
+        lines.append(f"Transient allocations per call (by function, {self.sampled_frames} sampled frames)")
+        calls = sorted(self.call_stats.items(), key=lambda c: c[1][1], reverse=True)
+        for name, (count, total, largest) in calls[:soak_top_functions]:
+            lines.append(f"  {name:<30} calls={count:<8} avg high-water={self.format_bytes(total / count):<10} "
+                         f"max={self.format_bytes(largest)}")
+        lines.append("")
+
+        lines.append(f"Kept at end of frame (by function, {self.sampled_frames} sampled frames)")
+        frames = max(self.sampled_frames, 1)
+        allocs = sorted(self.frame_allocs.items(), key=lambda a: a[1][1], reverse=True)
+        for name, (count, size) in allocs[:soak_top_functions]:
+            lines.append(f"  {name:<30} blocks={count / frames:<8.1f} bytes={self.format_bytes(size / frames)}")
+        lines.append("")
+
+        lines.append("GC pauses (by generation)")
+        for generation, (count, total, longest, collected) in sorted(self.gc_stats.items()):
+            lines.append(f"  gen {generation}: collections={count:<8} total={total * 1000:.1f}ms "
+                         f"avg={total / count * 1000:.3f}ms max={longest * 1000:.3f}ms collected={collected}")
+        lines.append("")
+
+        lines.append("GC pauses (by triggering function)")
+        triggers = sorted(self.gc_triggers.items(), key=lambda t: t[1][1], reverse=True)
+        for name, (count, total) in triggers[:soak_top_functions]:
+            lines.append(f"  {name:<30} collections={count:<8} total={total * 1000:.1f}ms")
+        lines.append("")
+
+        lines.append("Memory over time")
+        step = max(1, math.ceil(len(self.samples) / soak_report_rows))
+        rows = self.samples[::step]
+        if rows[-1] is not self.samples[-1]:
+            rows.append(self.samples[-1])
+        for seconds, frame, objects, rss in rows:
+            rss_text = self.format_bytes(rss) if rss is not None else "n/a"
+            lines.append(f"  t={seconds:>9.1f}s frame={frame:<10} objects={objects:<8} rss={rss_text}")
+        object_counts = [objects for _, _, objects, _ in self.samples]
+        lines.append(f"  objects min={min(object_counts)} max={max(object_counts)}")
+        rss_values = [rss for _, _, _, rss in self.samples if rss is not None]
+        if rss_values:
+            lines.append(f"  rss min={self.format_bytes(min(rss_values))} max={self.format_bytes(max(rss_values))}")
+        growth_rate = self.rss_growth_rate()
+        if growth_rate is None:
+            lines.append(f"  RSS growth: not enough samples after {soak_warmup_seconds}s warm-up")
+        else:
+            lines.append(f"  RSS growth: {self.format_bytes(growth_rate)}/hour (fit after {soak_warmup_seconds}s warm-up)")
+        lines.append("")
+
+        lines.append("Live collections")
+        lines.append(f"  enemy_cars={len(enemy_cars)} particles={len(particles)} "
+                     f"button_hover_effects={len(button_hover_effects)}")
+
+        with open(path, "w") as report:
+            report.write("\n".join(lines) + "\n")
+        print(f"Soak report written to {path}")
+
+soak_monitor = None
+
+def stream_assets():
+    """Load the next non-critical asset - one per frame so the frame loop never stalls"""
+    if pending_assets:
+        load_asset(*pending_assets.pop(0))
+
+def play_sound(name):
+    sound = sounds.get(name)
+    if sound:
+        sound.play()
+
 class Particle:
     def __init__(self, x, y, color, velocity):
         self.x = x
@@ -223,12 +625,10 @@ def handle_touch_input(mouse_pos, mouse_pressed):
     # Handle lane changes (trigger on press, not hold)
     if state == "playing":
         if touch_up_pressed and not old_touch_up and player_lane > 0:
-            if sound_enabled:
-                swap_sound.play()
+            play_sound("swap")
             player_lane -= 1
         elif touch_down_pressed and not old_touch_down and player_lane < 3:
-            if sound_enabled:
-                swap_sound.play()
+            play_sound("swap")
             player_lane += 1
         elif touch_pause_pressed and not old_touch_pause:
             state = "paused"
@@ -383,15 +783,158 @@ def draw_player():
         pygame.draw.rect(screen, WHITE, (player_x + 10, y + 5, 15, car_height - 10))
         pygame.draw.rect(screen, WHITE, (player_x + car_width - 25, y + 5, 15, car_height - 10))
 
-def spawn_enemy():
-    for _ in range(10):
-        lane = random.randint(0, 3)
-        lane_y = lanes[lane] - car_height // 2
-        too_close = any(car[3] == lane and car[0] < WIDTH + 150 for car in enemy_cars)
-        if not too_close:
-            enemy_color = random.choice([RED, ORANGE, PURPLE, GREEN])
-            return [WIDTH, lane_y, lane, enemy_color]  # Spawn from right side
-    return None
+def spawn_rate_for(score):
+    return max(20, 60 - score // 100)  # Faster spawning as score increases
+
+def speed_for(score):
+    return 1.0 + score / 1000
+
+def generate_waves(seed, lane_change_frames=lane_change_frames):
+    """Yield (frame, lane, color, score, distance) spawns for a run, skipping any that would
+    make the road impassable.
+
+    Score only depends on frames played, so the difficulty curve of game_loop() can be
+    replayed here ahead of time. Each candidate car is checked against the lanes the
+    player can still reach (one lane per lane_change_frames) while it passes them.
+    score and distance are the replayed score and road distance on the spawn frame,
+    used to check the replay stays in step with game_loop().
+    """
+    rng = random.Random(seed)
+    lane_count = len(lanes)
+    colors = [RED, ORANGE, PURPLE, GREEN]
+
+    # distances[t - distance_start] = road distance covered up to the end of frame t - 1
+    distances = [0.0]
+    distance_start = 0
+    curve_score = 0
+
+    def distance_at(t):
+        nonlocal curve_score
+        while len(distances) + distance_start <= t:
+            speed = speed_for(curve_score)
+            distances.append(distances[-1] + enemy_speed * speed)
+            curve_score += int(speed)
+        return distances[t - distance_start]
+
+    # Travel distances at which a car overlaps the player (1px slack for Rect rounding)
+    # and at which it is cleaned up
+    hit_start = WIDTH - player_x - car_width - 1
+    hit_end = WIDTH - player_x + car_width + 1
+    despawn = WIDTH + car_width + 50
+
+    def blocked_frames(frame):
+        """First and last frame a car spawned on this frame overlaps the player"""
+        base = distance_at(frame)
+        t = frame
+        while distance_at(t + 1) - base <= hit_start:
+            t += 1
+        first = t
+        while distance_at(t + 2) - base < hit_end:
+            t += 1
+        return first, t
+
+    # Reachability: reach[lane] is the frame the player could first be in that lane, or None
+    reach = [None] * lane_count
+    reach[1] = 0  # Every run starts in lane 1 (see reset_game)
+    reach_frame = 0
+    blocks = []  # (first, last, lane) of cars not yet past the player
+
+    def advance(reach, start, end, blocks):
+        """Step reachability from frame start to end; returns None if every lane is lost"""
+        for t in range(start + 1, end + 1):
+            blocked = {lane for first, last, lane in blocks if first <= t <= last}
+            previous = reach
+            reach = [None] * lane_count
+            for lane in range(lane_count):
+                if lane in blocked:
+                    continue
+                if previous[lane] is not None:
+                    reach[lane] = previous[lane]
+                elif any(previous[n] is not None and previous[n] <= t - lane_change_frames
+                         for n in (lane - 1, lane + 1) if 0 <= n < lane_count):
+                    reach[lane] = t
+            if all(r is None for r in reach):
+                return None
+        return reach
+
+    lane_spawn_distance = [None] * lane_count
+    score = 0
+    spawn_timer = 0
+    frame = 0
+    while True:
+        spawn_timer += 1
+        if spawn_timer >= spawn_rate_for(score):
+            spawn_timer = 0
+            # Lanes whose last car has been cleaned up, as in game_loop()
+            free_lanes = [lane for lane in range(lane_count)
+                          if lane_spawn_distance[lane] is None
+                          or distance_at(frame) - lane_spawn_distance[lane] >= despawn]
+            rng.shuffle(free_lanes)
+            first, last = blocked_frames(frame)
+            for lane in free_lanes:
+                candidate = blocks + [(first, last, lane)]
+                if advance(reach, reach_frame, last, candidate) is None:
+                    continue
+                # Later cars reach the player after this one, so frames before it are final
+                reach = advance(reach, reach_frame, first - 1, blocks)
+                reach_frame = first - 1
+                blocks = [b for b in candidate if b[1] >= reach_frame]
+                lane_spawn_distance[lane] = distance_at(frame)
+                yield frame, lane, rng.choice(colors), score, distance_at(frame)
+                break
+        score += int(speed_for(score))
+        frame += 1
+        # Earlier distances are never looked up again
+        if frame - distance_start >= 1024:
+            drop = min(frame - distance_start, len(distances) - 1)
+            del distances[:drop]
+            distance_start += drop
+
+class SpawnPattern:
+    """Lazily generated waves for one seed, shared between runs using the same seed"""
+    def __init__(self, seed):
+        self.seed = seed
+        self.waves = []
+        self.generator = generate_waves(seed)
+
+    def wave(self, index):
+        while len(self.waves) <= index:
+            self.waves.append(next(self.generator))
+        return self.waves[index]
+
+@functools.lru_cache(maxsize=spawn_pattern_cache_size)
+def spawn_pattern(seed):
+    return SpawnPattern(seed)
+
+class SpawnScheduler:
+    """Hands out one run's spawns in O(1) per tick from a SpawnPattern.
+
+    Patterns for an explicit seed are cached and shared, e.g. by batch simulations.
+    Without a seed the run gets a fresh random pattern that is not cached.
+    """
+    def __init__(self, seed=None):
+        if seed is None:
+            self.pattern = SpawnPattern(random.randrange(2 ** 32))
+        else:
+            self.pattern = spawn_pattern(seed)
+        self.index = 0
+        self.out_of_step = False
+        self.pattern.wave(spawn_lookahead)  # Generate the opening waves ahead of play
+
+    def spawn(self, frame, score):
+        wave_frame, lane, color, wave_score, _ = self.pattern.wave(self.index)
+        if wave_frame != frame:
+            return None
+        if wave_score != score and not self.out_of_step:
+            # Keep spawning on schedule, but the passability check assumed a different score
+            self.out_of_step = True
+            print(f"Warning: spawn schedule is out of step with game_loop() at frame {frame} "
+                  f"(score {score}, expected {wave_score})")
+        self.index += 1
+        self.pattern.wave(self.index + spawn_lookahead)
+        return [WIDTH, lanes[lane] - car_height // 2, lane, color]  # Spawn from right side
+
+spawn_scheduler = SpawnScheduler()
 
 def draw_enemies():
     for enemy in enemy_cars:
@@ -418,13 +961,14 @@ def detect_collision():
             return True, enemy
     return False, None
 
-def reset_game():
-    global enemy_cars, score, player_lane, spawn_timer, game_speed, particles, road_offset
+def reset_game(seed=None):
+    global enemy_cars, score, player_lane, run_frame, game_speed, particles, road_offset, spawn_scheduler
     enemy_cars.clear()
     particles.clear()
     score = 0
     player_lane = 1
-    spawn_timer = 0
+    run_frame = 0
+    spawn_scheduler = SpawnScheduler(seed)
     game_speed = 1.0
     road_offset = 0
 
@@ -433,7 +977,7 @@ def main_menu():
     state = "menu"
 
 def game_loop():
-    global player_lane, spawn_timer, score, state, game_speed, high_score, road_offset
+    global player_lane, run_frame, score, state, game_speed, high_score, road_offset
 
     # Update road movement
     road_offset += enemy_speed * game_speed
@@ -441,25 +985,21 @@ def game_loop():
     # Clean up off-screen enemies (now checking x position)
     enemy_cars[:] = [car for car in enemy_cars if car[0] > -car_width - 50]
 
-    # Spawn enemies
-    spawn_timer += 1
-    spawn_rate = max(20, 60 - score // 100)  # Faster spawning as score increases
-    if spawn_timer >= spawn_rate:
-        new_enemy = spawn_enemy()
-        if new_enemy:
-            enemy_cars.append(new_enemy)
-        spawn_timer = 0
+    # Spawn enemies from the pre-generated, passable wave schedule
+    new_enemy = spawn_scheduler.spawn(run_frame, score)
+    if new_enemy:
+        enemy_cars.append(new_enemy)
+    run_frame += 1
 
     # Update game speed
-    game_speed = 1.0 + score / 1000
+    game_speed = speed_for(score)
 
     move_enemies()
     
     # Check collision
     collision, hit_enemy = detect_collision()
     if collision:
-        if sound_enabled:
-            crash_sound.play()
+        play_sound("crash-sound-effect")
         # Create explosion effect
         player_y = lanes[player_lane]
         create_explosion(player_x + car_width//2, player_y, RED, 20)
@@ -624,9 +1164,62 @@ def start_menu():
         draw_text_centered("Use UP/DOWN arrows to move lanes", small_font, HEIGHT - 100, WHITE)
         draw_text_centered("Press P to pause during game", small_font, HEIGHT - 75, WHITE)
 
+def check_spawn_schedule(seed=1234, frames=20000):
+    """Self-check for the spawn scheduler, run with: python main.py --check-spawns"""
+    global state
+    def fail(message):
+        print(f"Spawn schedule check FAILED: {message}")
+        pygame.quit()
+        sys.exit(1)
+
+    # Drive game_loop() itself: spawn() compares the replayed score on every spawn frame,
+    # and the gap to each live car must match the replayed road distance
+    reset_game(seed)
+    state = "playing"
+    spawn_distance = {}
+    for _ in range(frames):
+        index = spawn_scheduler.index
+        game_loop()
+        particles.clear()
+        if spawn_scheduler.out_of_step:
+            fail("score differs from the replayed difficulty curve")
+        if spawn_scheduler.index == index:
+            continue
+        new_car = enemy_cars[-1]
+        distance = spawn_scheduler.pattern.waves[index][4]
+        for car in enemy_cars[:-1]:
+            gap = distance - spawn_distance[id(car)]
+            if not math.isclose(new_car[0] - car[0], gap):
+                fail("enemy movement is out of step with the spawn schedule")
+        spawn_distance[id(new_car)] = distance
+    spawned = spawn_scheduler.index
+
+    # A player who can never change lanes must never get a car in the starting lane,
+    # which the default reach does allow for the same seed
+    if not any(wave[1] == 1 for wave in spawn_scheduler.pattern.waves):
+        fail("the default schedule never uses the starting lane")
+    stuck_waves = generate_waves(seed, lane_change_frames=frames)
+    if any(next(stuck_waves)[1] == 1 for _ in range(spawned)):
+        fail("a car was placed in a lane the player cannot leave")
+
+    reset_game()
+    state = "menu"
+    print(f"Spawn schedule OK: {spawned} spawns over {frames} frames")
+
+if "--check-spawns" in sys.argv:
+    check_spawn_schedule()
+    pygame.quit()
+    sys.exit()
+
 # Main game loop
+if SOAK_MODE:
+    soak_monitor = SoakMonitor()
+
 running = True
 while running:
+    if soak_monitor:
+        soak_monitor.begin_frame()
+
     # Get mouse/touch input
     mouse_pos = pygame.mouse.get_pos()
     mouse_pressed = pygame.mouse.get_pressed()[0]
@@ -642,12 +1235,10 @@ while running:
             if state == "playing":
                 # Changed to UP/DOWN keys for vertical lane movement
                 if event.key == pygame.K_UP and player_lane > 0:
-                    if sound_enabled:
-                        swap_sound.play()
+                    play_sound("swap")
                     player_lane -= 1
                 elif event.key == pygame.K_DOWN and player_lane < 3:
-                    if sound_enabled:
-                        swap_sound.play()
+                    play_sound("swap")
                     player_lane += 1
                 elif event.key == pygame.K_p:
                     state = "paused"
@@ -705,5 +1296,14 @@ while running:
     pygame.display.flip()
     clock.tick(60)  # Increased to 60 FPS for smoother animation
 
+    # Stream in remaining assets after the frame is on screen
+    stream_assets()
+
+    if soak_monitor:
+        soak_monitor.end_frame(state)
+
+if soak_monitor:
+    soak_monitor.finish()
+
 pygame.quit()
 print(f"Game ended. Final Score: {score}, High Score: {high_score}")
\ No newline at end of file